@@ -319,7 +319,7 @@ class EnhancedTagStandardizer:
         skip_dirs = {'.obsidian', '.trash', '.git'}
         
         for file_path in self.vault_path.rglob('*.md'):
-            if any(skip_dir in file_path.parts for skip_dir in skip_dirs):
+            if not skip_dirs.isdisjoint(file_path.parts):
                 continue
             
             if self.process_file(file_path):
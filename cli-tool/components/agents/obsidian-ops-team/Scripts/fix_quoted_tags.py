@@ -12,9 +12,10 @@ def fix_quoted_tags(vault_path):
     """Fix single-quoted tags in all markdown files."""
     vault_path = Path(vault_path)
     files_updated = 0
+    skip_dirs = {'.obsidian', '.trash', '.git'}
     
     for file_path in vault_path.rglob('*.md'):
-        if any(skip in file_path.parts for skip in ['.obsidian', '.trash', '.git']):
+        if not skip_dirs.isdisjoint(file_path.parts):
             continue
             
         try:
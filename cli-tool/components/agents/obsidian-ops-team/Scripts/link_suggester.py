@@ -55,7 +55,7 @@ class LinkSuggester:
         skip_dirs = {'.obsidian', '.trash', 'System_Files', '.git'}
         
         for file_path in self.vault_path.rglob('*.md'):
-            if any(skip_dir in file_path.parts for skip_dir in skip_dirs):
+            if not skip_dirs.isdisjoint(file_path.parts):
                 continue
             
             try:
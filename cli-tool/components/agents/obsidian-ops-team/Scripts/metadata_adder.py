@@ -151,7 +151,7 @@ aliases: []
         
         for file_path in self.vault_path.rglob('*.md'):
             # Skip files in excluded directories
-            if any(skip_dir in file_path.parts for skip_dir in skip_dirs):
+            if not skip_dirs.isdisjoint(file_path.parts):
                 continue
             
             self.stats['processed'] += 1
@@ -253,9 +253,10 @@ class TagStandardizer:
     def analyze_existing_tags(self):
         """Analyze existing tags in the vault."""
         tag_files = defaultdict(list)
+        skip_dirs = {'.obsidian', '.trash', 'System_Files', '.git'}
         
         for file_path in self.vault_path.rglob('*.md'):
-            if any(skip_dir in file_path.parts for skip_dir in {'.obsidian', '.trash', 'System_Files', '.git'}):
+            if not skip_dirs.isdisjoint(file_path.parts):
                 continue
             
             try:
@@ -327,7 +328,7 @@ class TagStandardizer:
         skip_dirs = {'.obsidian', '.trash', 'System_Files', '.git'}
         
         for file_path in self.vault_path.rglob('*.md'):
-            if any(skip_dir in file_path.parts for skip_dir in skip_dirs):
+            if not skip_dirs.isdisjoint(file_path.parts):
                 continue
             
             self.files_processed += 1
@@ -14,15 +14,16 @@ tool_input = input_data.get("tool_input", {})
 command = tool_input.get("command", "")
 
 # Only validate git commit commands
-if tool_name != "Bash" or "git commit" not in command:
+start = command.find("git commit") if tool_name == "Bash" else -1
+if start < 0:
     sys.exit(0)
 
-# Extract commit message from -m flag
+# Extract commit message from -m flag, starting at the literal we already found
 # Handle both -m "message" and -m 'message' formats
-match = re.search(r'git commit.*?-m\s+["\']([^"\']+)["\']', command)
+match = re.search(r'git commit.*?-m\s+["\']([^"\']+)["\']', command[start:])
 if not match:
     # Also try heredoc format: -m "$(cat <<'EOF' ... EOF)"
-    heredoc_match = re.search(r'git commit.*?-m\s+"?\$\(cat\s+<<["\']?EOF["\']?\s*\n(.+?)\nEOF', command, re.DOTALL)
+    heredoc_match = re.search(r'git commit.*?-m\s+"?\$\(cat\s+<<["\']?EOF["\']?\s*\n(.+?)\nEOF', command[start:], re.DOTALL)
     if heredoc_match:
         commit_msg = heredoc_match.group(1).strip()
     else:
@@ -33,7 +34,7 @@ else:
 # Check if message follows Conventional Commits format
 # Format: type(scope)?: description
 # Types: feat, fix, docs, style, refactor, perf, test, chore, ci, build, revert
-conventional_pattern = r'^(feat|fix|docs|style|refactor|perf|test|chore|ci|build|revert)(\(.+\))?:\s.+'
+conventional_pattern = r'^(feat|fix|docs|style|refactor|perf|test|chore|ci|build|revert)(\([^()\n]+\))?:\s.+'
 
 if not re.match(conventional_pattern, commit_msg):
     reason = f"""❌ Invalid commit message format
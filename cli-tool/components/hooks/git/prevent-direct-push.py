@@ -3,6 +3,8 @@ import json
 import sys
 import subprocess
 
+PROTECTED_BRANCHES = frozenset({"main", "develop"})
+
 try:
     input_data = json.load(sys.stdin)
 except json.JSONDecodeError as e:
@@ -35,12 +37,12 @@ is_force_push = "--force" in push_cmd or "-f" in push_cmd
 targets_protected = (
     "origin main" in push_cmd or
     "origin develop" in push_cmd or
-    current_branch in ["main", "develop"]
+    current_branch in PROTECTED_BRANCHES
 )
 
 # Block direct push to main/develop (unless force push which is already dangerous)
 if targets_protected and not is_force_push:
-    if current_branch in ["main", "develop"] or "origin main" in push_cmd or "origin develop" in push_cmd:
+    if current_branch in PROTECTED_BRANCHES or "origin main" in push_cmd or "origin develop" in push_cmd:
         reason = f"""❌ Direct push to main/develop is not allowed!
 
 Protected branches:
@@ -3,6 +3,9 @@ import json
 import sys
 import re
 
+# Base branches allowed without a Git Flow prefix
+ALLOWED_BASE_BRANCHES = frozenset({"main", "develop"})
+
 try:
     input_data = json.load(sys.stdin)
 except json.JSONDecodeError as e:
@@ -14,18 +17,19 @@ tool_input = input_data.get("tool_input", {})
 command = tool_input.get("command", "")
 
 # Only validate git checkout -b commands
-if tool_name != "Bash" or "git checkout -b" not in command:
+start = command.find("git checkout -b") if tool_name == "Bash" else -1
+if start < 0:
     sys.exit(0)
 
-# Extract branch name
-match = re.search(r'git checkout -b\s+([^\s]+)', command)
+# Extract branch name, starting the regex at the literal we already found
+match = re.search(r'git checkout -b\s+(\S+)', command[start:])
 if not match:
     sys.exit(0)
 
 branch_name = match.group(1)
 
 # Allow main and develop branches
-if branch_name in ["main", "develop"]:
+if branch_name in ALLOWED_BASE_BRANCHES:
     sys.exit(0)
 
 # Validate Git Flow naming convention
@@ -6,6 +6,7 @@ This creates docs/api/agents.json for the CLI tool to use
 
 import json
 import os
+from json_output import write_json_atomic
 
 def generate_agents_api():
     """Generate the agents API file from components.json"""
@@ -46,12 +47,11 @@ def generate_agents_api():
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         
         # Write the API file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump({
-                'agents': agents,
-                'version': '1.0.0',
-                'total': len(agents)
-            }, f, indent=2)
+        write_json_atomic(output_path, {
+            'agents': agents,
+            'version': '1.0.0',
+            'total': len(agents)
+        }, ensure_ascii=True)
         
         print(f"✅ Generated agents API with {len(agents)} agents")
         print(f"📄 Output: {output_path}")
@@ -1,14 +1,28 @@
 import os
 import json
 import requests
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dotenv import load_dotenv
+from json_output import write_json_atomic
+import threading
 import time
 import re
 
 # Load environment variables
 load_dotenv()
 
+# run_scrapers gives each scraper thread its own requests.Session: repeated
+# requests to that scraper's host reuse the connection, and no Session is
+# shared across threads (requests doesn't guarantee Sessions are thread-safe)
+_scraper_state = threading.local()
+
+def http_get(url, **kwargs):
+    """GET through the current scraper's Session, or plain requests outside run_scrapers"""
+    session = getattr(_scraper_state, 'session', None) or requests
+    return session.get(url, **kwargs)
+
 def scrape_with_rapidapi_jobs():
     """
     Use RapidAPI Jobs Search to find Claude-related positions
@@ -44,7 +58,7 @@ def scrape_with_rapidapi_jobs():
                 "num_results": "20"
             }
             
-            response = requests.get(url, headers=headers, params=querystring)
+            response = http_get(url, headers=headers, params=querystring)
             
             if response.status_code == 200:
                 data = response.json()
@@ -159,15 +173,16 @@ def scrape_with_serper_jobs():
     
     return jobs
 
+JOB_INDICATORS = (
+    'hiring', 'job', 'position', 'career', 'apply', 'join',
+    'engineer', 'developer', 'programmer', 'architect',
+    'we are looking', 'seeking', 'opportunity', 'role'
+)
+
 def is_job_posting(text):
     """Check if text looks like a job posting"""
-    job_indicators = [
-        'hiring', 'job', 'position', 'career', 'apply', 'join',
-        'engineer', 'developer', 'programmer', 'architect',
-        'we are looking', 'seeking', 'opportunity', 'role'
-    ]
     text_lower = text.lower()
-    return any(indicator in text_lower for indicator in job_indicators)
+    return any(indicator in text_lower for indicator in JOB_INDICATORS)
 
 def extract_job_info_from_serper(title, snippet, link):
     """Extract clean job information from Serper search result"""
@@ -411,7 +426,7 @@ def scrape_github_jobs():
             'per_page': 50
         }
         
-        response = requests.get(search_url, headers=headers, params=search_params)
+        response = http_get(search_url, headers=headers, params=search_params)
         if response.status_code == 200:
             results = response.json()
             for item in results.get('items', []):
@@ -443,7 +458,7 @@ def scrape_ycombinator_jobs():
             'numericFilters': f'created_at_i>{int(time.time()) - 86400*60}'  # Last 60 days
         }
         
-        response = requests.get(hn_search_url, params=search_params)
+        response = http_get(hn_search_url, params=search_params)
         if response.status_code == 200:
             threads = response.json().get('hits', [])
             
@@ -458,7 +473,7 @@ def scrape_ycombinator_jobs():
                         'hitsPerPage': 50
                     }
                     
-                    comment_response = requests.get(comments_url, params=comment_params)
+                    comment_response = http_get(comments_url, params=comment_params)
                     if comment_response.status_code == 200:
                         comments = comment_response.json().get('hits', [])
                         
@@ -550,7 +565,7 @@ def scrape_remote_ok():
             'User-Agent': 'claude-code-templates-job-scraper'
         }
         
-        response = requests.get(url, headers=headers)
+        response = http_get(url, headers=headers)
         if response.status_code == 200:
             data = response.json()
             for job_data in data[1:]:  # First item is metadata
@@ -594,7 +609,7 @@ def scrape_weworkremotely():
             'User-Agent': 'claude-code-templates-job-scraper'
         }
         
-        response = requests.get(rss_url, headers=headers)
+        response = http_get(rss_url, headers=headers)
         if response.status_code == 200:
             root = ET.fromstring(response.content)
             
@@ -680,6 +695,15 @@ def extract_job_from_github_issue(item):
         'salary': 0
     }
 
+# ONLY Claude-specific keywords - must contain "claude"
+CLAUDE_KEYWORDS = (
+    'claude code', 'claude-code', 'anthropic claude', 'claude ai', 
+    'claude coder', 'claude assistant', 'claude developer', 'claude engineer',
+    'work with claude', 'using claude', 'claude experience', 'claude integration'
+)
+
+CLAUDE_JOB_WORDS = ('hiring', 'position', 'engineer', 'developer', 'role', 'job', 'career', 'experience', 'skills')
+
 def is_claude_code_related(text):
     """
     Check if text specifically mentions Claude (very strict filtering)
@@ -688,40 +712,41 @@ def is_claude_code_related(text):
         return False
         
     text_lower = str(text).lower()
-    
-    # ONLY Claude-specific keywords - must contain "claude"
-    claude_keywords = [
-        'claude code', 'claude-code', 'anthropic claude', 'claude ai', 
-        'claude coder', 'claude assistant', 'claude developer', 'claude engineer',
-        'work with claude', 'using claude', 'claude experience', 'claude integration'
-    ]
-    
+
+    # Every keyword below contains "claude", so bail out early on the common case
+    if 'claude' not in text_lower:
+        return False
+
     # Must explicitly mention Claude in some form
-    has_claude_mention = any(keyword in text_lower for keyword in claude_keywords)
+    if any(keyword in text_lower for keyword in CLAUDE_KEYWORDS):
+        return True
     
-    # Additional check: just "claude" + job context
-    has_claude_word = 'claude' in text_lower
-    job_words = ['hiring', 'position', 'engineer', 'developer', 'role', 'job', 'career', 'experience', 'skills']
-    has_job_context = any(word in text_lower for word in job_words)
-    
-    # Return True only if Claude is mentioned AND it's in a job context
-    return has_claude_mention or (has_claude_word and has_job_context)
+    # Otherwise "claude" (checked above) must appear in a job context
+    return any(word in text_lower for word in CLAUDE_JOB_WORDS)
+
+# Common patterns in job titles, compiled once for every posting
+COMPANY_NAME_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(\w+)\s+is\s+hiring',
+    r'(\w+)\s+hiring',
+    r'join\s+(\w+)',
+    r'(\w+)\s+looking\s+for',
+    r'(\w+)\s+seeks?',
+)]
+
+LOCATION_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'location[:\s]+([^,\n]+)',
+    r'based in ([^,\n]+)',
+    r'(\w+,\s*\w+)',  # City, State/Country
+)]
 
 def extract_company_name(title, body, fallback):
     """
     Extract company name from job posting
     """
-    # Common patterns in job titles
-    patterns = [
-        r'(\w+)\s+is\s+hiring',
-        r'(\w+)\s+hiring',
-        r'join\s+(\w+)',
-        r'(\w+)\s+looking\s+for',
-        r'(\w+)\s+seeks?',
-    ]
+    text = title + ' ' + body
     
-    for pattern in patterns:
-        match = re.search(pattern, title + ' ' + body, re.IGNORECASE)
+    for pattern in COMPANY_NAME_PATTERNS:
+        match = pattern.search(text)
         if match:
             return match.group(1).title()
     
@@ -732,11 +757,6 @@ def extract_location(title, body):
     Extract location from job posting
     """
     remote_keywords = ['remote', 'anywhere', 'distributed', 'work from home']
-    location_patterns = [
-        r'location[:\s]+([^,\n]+)',
-        r'based in ([^,\n]+)',
-        r'(\w+,\s*\w+)',  # City, State/Country
-    ]
     
     text = (title + ' ' + body).lower()
     
@@ -745,8 +765,8 @@ def extract_location(title, body):
         return 'Remote'
     
     # Look for specific locations
-    for pattern in location_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in LOCATION_PATTERNS:
+        match = pattern.search(text)
         if match:
             return match.group(1).strip().title()
     
@@ -886,6 +906,32 @@ def generate_sample_jobs():
     
     return sample_jobs
 
+def run_scrapers(scrapers, label):
+    """
+    Run independent scrapers concurrently and collect their jobs in order.
+    Each scraper talks to its own host and rate limits its own requests.
+    Progress output from concurrent scrapers may interleave.
+    """
+    if not scrapers:
+        return []
+
+    def run(scraper):
+        with requests.Session() as session:
+            _scraper_state.session = session
+            try:
+                return scraper()
+            except Exception as e:
+                print(f"⚠️ Error with {label} {scraper.__name__}: {e}")
+                return []
+            finally:
+                _scraper_state.session = None
+
+    jobs = []
+    with ThreadPoolExecutor(max_workers=len(scrapers)) as executor:
+        for scraper_jobs in executor.map(run, scrapers):
+            jobs.extend(scraper_jobs)
+    return jobs
+
 def generate_claude_jobs_json():
     """
     Main function to scrape and generate Claude Code jobs JSON
@@ -910,13 +956,7 @@ def generate_claude_jobs_json():
     ]
     
     # Try API sources first
-    for scraper in api_scrapers:
-        try:
-            jobs = scraper()
-            all_jobs.extend(jobs)
-            time.sleep(1)
-        except Exception as e:
-            print(f"⚠️ Error with API scraper {scraper.__name__}: {e}")
+    all_jobs.extend(run_scrapers(api_scrapers, 'API scraper'))
     
     # If no jobs from APIs, try traditional scraping
     if len(all_jobs) == 0:
@@ -927,13 +967,7 @@ def generate_claude_jobs_json():
         print(f"🎯 Got {len(all_jobs)} jobs from APIs, skipping traditional scraping")
         scrapers = []
     
-    for scraper in scrapers:
-        try:
-            jobs = scraper()
-            all_jobs.extend(jobs)
-            time.sleep(1)  # Rate limiting
-        except Exception as e:
-            print(f"⚠️ Error with scraper {scraper.__name__}: {e}")
+    all_jobs.extend(run_scrapers(scrapers, 'scraper'))
     
     # Remove duplicates based on job_link
     seen_links = set()
@@ -957,18 +991,14 @@ def generate_claude_jobs_json():
     # Save to docs directory
     output_path = 'docs/claude-jobs.json'
     try:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(jobs_data, f, indent=2, ensure_ascii=False)
+        write_json_atomic(output_path, jobs_data)
         print(f"✅ Successfully generated {output_path}")
         
         # Log summary
         print("\n--- Scraping Summary ---")
         print(f"Total unique jobs found: {len(unique_jobs)}")
         
-        sources_count = {}
-        for job in unique_jobs:
-            source = job['source']
-            sources_count[source] = sources_count.get(source, 0) + 1
+        sources_count = Counter(job['source'] for job in unique_jobs)
         
         for source, count in sources_count.items():
             print(f"  - {source}: {count} jobs")
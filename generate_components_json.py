@@ -1,14 +1,27 @@
 import os
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import subprocess
 from collections import defaultdict
 from dotenv import load_dotenv
 from pathlib import Path
+from json_output import write_json_atomic
 
 # Load environment variables
 load_dotenv()
 
+# Keep-alive session for all Supabase requests; urllib3 retries transient gateway errors
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    max_retries=Retry(total=3, backoff_factor=2, status_forcelist=[502, 503, 504], raise_on_status=False)
+))
+
+# Seconds to wait on a Supabase connect or read; retries only fire once a request fails,
+# so without this a stalled socket hangs the CI job
+REQUEST_TIMEOUT = 30
+
 def run_security_validation():
     """
     Run security validation on all components and return the results.
@@ -225,19 +238,23 @@ def fetch_download_stats():
         
         # First, let's query component_downloads to aggregate counts per component
         # We need to handle pagination since there can be many records
-        api_url = f"{supabase_url}/rest/v1/component_downloads"
+        # Only the two columns used for aggregation are needed
+        api_url = f"{supabase_url}/rest/v1/component_downloads?select=component_type,component_name"
         
-        all_downloads = []
+        records_fetched = 0
         offset = 0
         limit = 1000
 
+        # Aggregate downloads by component as each page arrives, so raw rows are never retained
+        component_totals = defaultdict(int)
+
         # Fetch all records with pagination
         max_pages = 200  # Safety limit (200 pages * 1000 records = 200,000 max)
         for page in range(max_pages):
             paginated_headers = headers.copy()
             paginated_headers['Range'] = f'{offset}-{offset + limit - 1}'
             
-            response = requests.get(api_url, headers=paginated_headers)
+            response = SESSION.get(api_url, headers=paginated_headers, timeout=REQUEST_TIMEOUT)
             
             if response.status_code not in [200, 206]:
                 print(f"  Page {page+1}: Got status {response.status_code}, stopping")
@@ -247,7 +264,24 @@ def fetch_download_stats():
             if not batch:
                 break
                 
-            all_downloads.extend(batch)
+            records_fetched += len(batch)
+
+            for download in batch:
+                component_type = download.get('component_type', '')
+                component_name = download.get('component_name', '')
+
+                if component_type and component_name:
+                    # Handle case where component_name already includes category
+                    if '/' in component_name:
+                        name_parts = component_name.split('/')
+                        category = name_parts[0]
+                        actual_name = name_parts[-1]
+                    else:
+                        actual_name = component_name
+                        category = 'general'
+
+                    # Key for aggregation matching trending data structure
+                    component_totals[(component_type, category, actual_name)] += 1
             
             # Check if we have more records to fetch
             content_range = response.headers.get('content-range', '')
@@ -271,44 +305,18 @@ def fetch_download_stats():
             
             # Progress indicator every 10 pages
             if (page + 1) % 10 == 0:
-                print(f"  Fetched {len(all_downloads)} records so far...")
+                print(f"  Fetched {records_fetched} records so far...")
         
-        print(f"📊 Total records fetched: {len(all_downloads)}")
+        print(f"📊 Total records fetched: {records_fetched}")
         
         # If we fetched records, use them
-        if len(all_downloads) > 0:
-            # Process component_downloads data
-            downloads = all_downloads
-            
-            # Aggregate downloads by component
-            download_counts = {}
-            component_totals = defaultdict(int)
-            
-            for download in downloads:
-                component_type = download.get('component_type', '')
-                component_name = download.get('component_name', '')
-
-                if component_type and component_name:
-                    # Handle case where component_name already includes category
-                    if '/' in component_name:
-                        category = component_name.split('/')[0]
-                        actual_name = component_name.split('/')[-1]
-                    else:
-                        actual_name = component_name
-                        category = 'general'
-
-                    # Create a key for aggregation matching trending data structure
-                    key = f"{component_type}|{category}|{actual_name}"
-                    component_totals[key] += 1
-
+        if records_fetched > 0:
             # Convert to the format we need using the TYPE_MAPPING constant
-            for key, count in component_totals.items():
-                parts = key.split('|')
-                if len(parts) == 3:
-                    component_type, category, component_name = parts
-                    mapped_type = TYPE_MAPPING.get(component_type, component_type + 's')
-                    final_key = f"{mapped_type}/{category}/{component_name}"
-                    download_counts[final_key] = count
+            download_counts = {}
+            for (component_type, category, component_name), count in component_totals.items():
+                mapped_type = TYPE_MAPPING.get(component_type, component_type + 's')
+                final_key = f"{mapped_type}/{category}/{component_name}"
+                download_counts[final_key] = count
             
             print(f"✅ Fetched and aggregated {len(download_counts)} component download stats")
             return download_counts
@@ -316,7 +324,7 @@ def fetch_download_stats():
             # Try alternative: fetch from download_stats table if it exists
             print("⚠️ No data from component_downloads, trying download_stats table...")
             alt_url = f"{supabase_url}/rest/v1/download_stats"
-            alt_response = requests.get(alt_url, headers=headers)
+            alt_response = SESSION.get(alt_url, headers=headers, timeout=REQUEST_TIMEOUT)
             
             if alt_response.status_code == 200:
                 print("📊 Using download_stats table instead...")
@@ -330,8 +338,9 @@ def fetch_download_stats():
 
                     # Handle case where component_name already includes category
                     if '/' in component_name:
-                        category = component_name.split('/')[0]
-                        actual_name = component_name.split('/')[-1]
+                        name_parts = component_name.split('/')
+                        category = name_parts[0]
+                        actual_name = name_parts[-1]
                     else:
                         actual_name = component_name
                         category = 'general'
@@ -722,8 +731,7 @@ def generate_components_json():
         print("✅ Added components marketplace metadata to components.json")
 
     try:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(components_data, f, indent=2, ensure_ascii=False)
+        write_json_atomic(output_path, components_data)
         print(f"Successfully generated {output_path} with file content.")
         
         # Log summary
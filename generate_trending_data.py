@@ -4,16 +4,126 @@ Trending Data Generator Script
 Fetches download data from Supabase and generates trending-data.json for the Claude Code Templates project.
 """
 
-import json
 import os
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta, timezone
 from collections import defaultdict, Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from dotenv import load_dotenv
+from json_output import write_json_atomic
 
 # Load environment variables
 load_dotenv()
 
+# Page fetches run on worker threads and requests doesn't guarantee Sessions
+# are thread-safe, so each thread keeps its own keep-alive Session
+_session_state = threading.local()
+
+def get_session():
+    """Return this thread's Supabase session; urllib3 retries transient gateway errors"""
+    session = getattr(_session_state, 'session', None)
+    if session is None:
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(
+            max_retries=Retry(total=3, backoff_factor=2, status_forcelist=[502, 503, 504], raise_on_status=False)
+        ))
+        _session_state.session = session
+    return session
+
+# Seconds to wait on a Supabase connect or read; retries only fire once a request fails,
+# so without this a stalled socket hangs the CI job
+REQUEST_TIMEOUT = 30
+
+OUTPUT_FILE = "docs/trending-data.json"
+
+# Map component types to plural for consistency in chart series
+CHART_TYPE_MAPPING = {
+    'command': 'commands',
+    'agent': 'agents',
+    'setting': 'settings',
+    'hook': 'hooks',
+    'mcp': 'mcps',
+    'skill': 'skills',
+    'template': 'templates',
+    'plugin': 'plugins',
+    'sandbox': 'sandbox'
+}
+
+# Country code to name and flag mapping
+COUNTRY_INFO = {
+    'US': {'name': 'United States', 'flag': '🇺🇸'},
+    'GB': {'name': 'United Kingdom', 'flag': '🇬🇧'},
+    'IN': {'name': 'India', 'flag': '🇮🇳'},
+    'DE': {'name': 'Germany', 'flag': '🇩🇪'},
+    'CA': {'name': 'Canada', 'flag': '🇨🇦'},
+    'FR': {'name': 'France', 'flag': '🇫🇷'},
+    'AU': {'name': 'Australia', 'flag': '🇦🇺'},
+    'JP': {'name': 'Japan', 'flag': '🇯🇵'},
+    'BR': {'name': 'Brazil', 'flag': '🇧🇷'},
+    'ES': {'name': 'Spain', 'flag': '🇪🇸'},
+    'IT': {'name': 'Italy', 'flag': '🇮🇹'},
+    'NL': {'name': 'Netherlands', 'flag': '🇳🇱'},
+    'SE': {'name': 'Sweden', 'flag': '🇸🇪'},
+    'CH': {'name': 'Switzerland', 'flag': '🇨🇭'},
+    'PL': {'name': 'Poland', 'flag': '🇵🇱'},
+    'MX': {'name': 'Mexico', 'flag': '🇲🇽'},
+    'CN': {'name': 'China', 'flag': '🇨🇳'},
+    'KR': {'name': 'South Korea', 'flag': '🇰🇷'},
+    'SG': {'name': 'Singapore', 'flag': '🇸🇬'},
+    'IE': {'name': 'Ireland', 'flag': '🇮🇪'},
+    'NO': {'name': 'Norway', 'flag': '🇳🇴'},
+    'FI': {'name': 'Finland', 'flag': '🇫🇮'},
+    'DK': {'name': 'Denmark', 'flag': '🇩🇰'},
+    'BE': {'name': 'Belgium', 'flag': '🇧🇪'},
+    'AT': {'name': 'Austria', 'flag': '🇦🇹'},
+    'NZ': {'name': 'New Zealand', 'flag': '🇳🇿'},
+    'PT': {'name': 'Portugal', 'flag': '🇵🇹'},
+    'IL': {'name': 'Israel', 'flag': '🇮🇱'},
+    'AR': {'name': 'Argentina', 'flag': '🇦🇷'},
+    'CO': {'name': 'Colombia', 'flag': '🇨🇴'},
+    'CL': {'name': 'Chile', 'flag': '🇨🇱'},
+    'ZA': {'name': 'South Africa', 'flag': '🇿🇦'},
+    'RU': {'name': 'Russia', 'flag': '🇷🇺'},
+    'TR': {'name': 'Turkey', 'flag': '🇹🇷'},
+    'TH': {'name': 'Thailand', 'flag': '🇹🇭'},
+    'MY': {'name': 'Malaysia', 'flag': '🇲🇾'},
+    'ID': {'name': 'Indonesia', 'flag': '🇮🇩'},
+    'PH': {'name': 'Philippines', 'flag': '🇵🇭'},
+    'VN': {'name': 'Vietnam', 'flag': '🇻🇳'},
+    'PK': {'name': 'Pakistan', 'flag': '🇵🇰'},
+    'BD': {'name': 'Bangladesh', 'flag': '🇧🇩'},
+    'UA': {'name': 'Ukraine', 'flag': '🇺🇦'},
+    'RO': {'name': 'Romania', 'flag': '🇷🇴'},
+    'CZ': {'name': 'Czech Republic', 'flag': '🇨🇿'},
+    'GR': {'name': 'Greece', 'flag': '🇬🇷'},
+    'HU': {'name': 'Hungary', 'flag': '🇭🇺'}
+}
+
+# Map component types to expected names
+TRENDING_TYPE_MAPPING = {
+    'command': 'commands',
+    'commands': 'commands',
+    'agent': 'agents',
+    'agents': 'agents',
+    'setting': 'settings',
+    'settings': 'settings',
+    'hook': 'hooks',
+    'hooks': 'hooks',
+    'mcp': 'mcps',
+    'mcps': 'mcps',
+    'skill': 'skills',
+    'skills': 'skills',
+    'template': 'templates',
+    'templates': 'templates',
+    'plugin': 'plugins',
+    'plugins': 'plugins',
+    'sandbox': 'sandbox'
+}
+
 def main():
     """Main function to generate trending data"""
     print("🚀 Generating trending data from Supabase...")
@@ -39,7 +149,7 @@ def main():
         # Get total count first
         count_url = f"{supabase_url}/rest/v1/component_downloads"
         count_headers = {**headers, 'Prefer': 'count=exact'}
-        count_response = requests.head(count_url, headers=count_headers)
+        count_response = get_session().head(count_url, headers=count_headers, timeout=REQUEST_TIMEOUT)
         
         total_count = 0
         if 'content-range' in count_response.headers:
@@ -50,24 +160,50 @@ def main():
         # Fetch all data using pagination to bypass 1000 record limit
         all_downloads = []
         page_size = 1000
+        max_records = 200000  # Safety limit - get all historical data for accurate totals
+        
+        # Order by created_at descending to get most recent records first, and
+        # only select the columns process_downloads_data reads
+        api_url = (
+            f"{supabase_url}/rest/v1/component_downloads"
+            "?select=component_type,component_name,category,country,download_timestamp"
+            "&order=created_at.desc"
+        )
+        
+        # Offset the sequential walk below starts from, or None when nothing is left
         offset = 0
+        if total_count:
+            # Page boundaries are known up front, so request them concurrently
+            page_offsets = range(0, min(total_count, max_records), page_size)
+            offset = None
+            fetch = partial(fetch_page, api_url, headers, page_size=page_size)
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = [executor.submit(fetch, page_offset) for page_offset in page_offsets]
+                try:
+                    for page_number, future in enumerate(futures, 1):
+                        page_data = future.result()
+                        if not page_data:
+                            break
+                        all_downloads.extend(page_data)
+                        print(f"📄 Fetched page {page_number}: {len(page_data)} records (Total: {len(all_downloads)})")
+                    else:
+                        # Rows inserted after the count push the oldest rows past the
+                        # planned pages, so keep walking while the last page is full
+                        if len(page_data) == page_size:
+                            offset = page_offsets[-1] + page_size
+                finally:
+                    # Stop like the sequential walk does: on an empty page or a raised
+                    # error, drop the queued pages instead of waiting on discarded requests
+                    executor.shutdown(wait=False, cancel_futures=True)
         
-        while True:
-            # Add Range header to get specific page
-            paginated_headers = {
-                **headers,
-                'Range': f'{offset}-{offset + page_size - 1}'
-            }
-            
-            # Order by created_at descending to get most recent records first
-            api_url = f"{supabase_url}/rest/v1/component_downloads?order=created_at.desc"
-            response = requests.get(api_url, headers=paginated_headers)
-            
-            if response.status_code != 200 and response.status_code != 206:
-                print(f"❌ API Error: {response.status_code} - {response.text}")
+        # Walk the remaining pages until a short one comes back
+        while offset is not None:
+            # Safety break to prevent infinite loops
+            if len(all_downloads) >= max_records:
+                print("⚠️  Reached safety limit of 200,000 records")
                 break
             
-            page_data = response.json()
+            page_data = fetch_page(api_url, headers, offset, page_size)
             if not page_data:
                 break
                 
@@ -79,11 +215,6 @@ def main():
                 break
                 
             offset += page_size
-            
-            # Safety break to prevent infinite loops - get all data for accurate totals
-            if len(all_downloads) >= 200000:  # Increased to get all historical data
-                print("⚠️  Reached safety limit of 200,000 records")
-                break
         
         if not all_downloads:
             print("❌ No data fetched from Supabase")
@@ -95,11 +226,9 @@ def main():
             trending_data = process_downloads_data(all_downloads)
         
         # Write to JSON file
-        output_file = "docs/trending-data.json"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(trending_data, f, indent=2, ensure_ascii=False)
+        write_json_atomic(OUTPUT_FILE, trending_data)
         
-        print(f"✅ Successfully generated {output_file}")
+        print(f"✅ Successfully generated {OUTPUT_FILE}")
         print(f"📊 Statistics:")
         for component_type, items in trending_data['trending'].items():
             print(f"   • {component_type}: {len(items)} items")
@@ -110,11 +239,24 @@ def main():
         trending_data = generate_fallback_trending_data()
         
         # Write fallback data
-        output_file = "docs/trending-data.json"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(trending_data, f, indent=2, ensure_ascii=False)
+        write_json_atomic(OUTPUT_FILE, trending_data)
         
-        print(f"✅ Generated fallback {output_file}")
+        print(f"✅ Generated fallback {OUTPUT_FILE}")
+
+def fetch_page(api_url, headers, offset, page_size):
+    """Fetch one Range-delimited page of downloads, or None on an API error"""
+    # Add Range header to get specific page
+    paginated_headers = {
+        **headers,
+        'Range': f'{offset}-{offset + page_size - 1}'
+    }
+    response = get_session().get(api_url, headers=paginated_headers, timeout=REQUEST_TIMEOUT)
+    
+    if response.status_code != 200 and response.status_code != 206:
+        print(f"❌ API Error: {response.status_code} - {response.text}")
+        return None
+    
+    return response.json()
 
 def process_downloads_data(downloads):
     """Process raw download data and generate trending structure"""
@@ -184,8 +326,9 @@ def process_downloads_data(downloads):
 
         # Handle case where component_name already includes category (like "frontend/react-expert")
         if '/' in component_name:
-            category = component_name.split('/')[0]
-            actual_name = component_name.split('/')[-1]
+            name_parts = component_name.split('/')
+            category = name_parts[0]
+            actual_name = name_parts[-1]
         else:
             actual_name = component_name
 
@@ -223,18 +366,7 @@ def process_downloads_data(downloads):
             download_date = download_time.strftime('%Y-%m-%d')
 
             # Map component types to plural for consistency
-            type_mapping = {
-                'command': 'commands',
-                'agent': 'agents',
-                'setting': 'settings',
-                'hook': 'hooks',
-                'mcp': 'mcps',
-                'skill': 'skills',
-                'template': 'templates',
-                'plugin': 'plugins',
-                'sandbox': 'sandbox'
-            }
-            mapped_type = type_mapping.get(component_type, component_type + 's')
+            mapped_type = CHART_TYPE_MAPPING.get(component_type, component_type + 's')
             chart_data[download_date][mapped_type] += 1
 
     # Debug: Print total counts by period
@@ -296,11 +428,13 @@ def process_downloads_data(downloads):
             chart_series[category].append(cumulative)
 
     # Calculate global statistics from ALL components (before limiting to top 10)
+    # Every download bumps exactly one component's counters, so the per-period
+    # tallies kept in the loop above already equal the sums across components
     total_components = len(component_stats)
-    total_all_downloads = sum(stats['total'] for stats in component_stats.values())
-    total_month_downloads = sum(stats['month'] for stats in component_stats.values())
-    total_week_downloads = sum(stats['week'] for stats in component_stats.values())
-    total_today_downloads = sum(stats['today'] for stats in component_stats.values())
+    total_all_downloads = len(downloads)
+    total_month_downloads = month_count
+    total_week_downloads = week_count
+    total_today_downloads = today_count
 
     print(f"📊 Global Statistics:")
     print(f"   • Total Components: {total_components}")
@@ -313,60 +447,10 @@ def process_downloads_data(downloads):
     # Get top 5 countries by downloads
     top_countries = country_downloads.most_common(5)
 
-    # Country code to name and flag mapping
-    country_info = {
-        'US': {'name': 'United States', 'flag': '🇺🇸'},
-        'GB': {'name': 'United Kingdom', 'flag': '🇬🇧'},
-        'IN': {'name': 'India', 'flag': '🇮🇳'},
-        'DE': {'name': 'Germany', 'flag': '🇩🇪'},
-        'CA': {'name': 'Canada', 'flag': '🇨🇦'},
-        'FR': {'name': 'France', 'flag': '🇫🇷'},
-        'AU': {'name': 'Australia', 'flag': '🇦🇺'},
-        'JP': {'name': 'Japan', 'flag': '🇯🇵'},
-        'BR': {'name': 'Brazil', 'flag': '🇧🇷'},
-        'ES': {'name': 'Spain', 'flag': '🇪🇸'},
-        'IT': {'name': 'Italy', 'flag': '🇮🇹'},
-        'NL': {'name': 'Netherlands', 'flag': '🇳🇱'},
-        'SE': {'name': 'Sweden', 'flag': '🇸🇪'},
-        'CH': {'name': 'Switzerland', 'flag': '🇨🇭'},
-        'PL': {'name': 'Poland', 'flag': '🇵🇱'},
-        'MX': {'name': 'Mexico', 'flag': '🇲🇽'},
-        'CN': {'name': 'China', 'flag': '🇨🇳'},
-        'KR': {'name': 'South Korea', 'flag': '🇰🇷'},
-        'SG': {'name': 'Singapore', 'flag': '🇸🇬'},
-        'IE': {'name': 'Ireland', 'flag': '🇮🇪'},
-        'NO': {'name': 'Norway', 'flag': '🇳🇴'},
-        'FI': {'name': 'Finland', 'flag': '🇫🇮'},
-        'DK': {'name': 'Denmark', 'flag': '🇩🇰'},
-        'BE': {'name': 'Belgium', 'flag': '🇧🇪'},
-        'AT': {'name': 'Austria', 'flag': '🇦🇹'},
-        'NZ': {'name': 'New Zealand', 'flag': '🇳🇿'},
-        'PT': {'name': 'Portugal', 'flag': '🇵🇹'},
-        'IL': {'name': 'Israel', 'flag': '🇮🇱'},
-        'AR': {'name': 'Argentina', 'flag': '🇦🇷'},
-        'CO': {'name': 'Colombia', 'flag': '🇨🇴'},
-        'CL': {'name': 'Chile', 'flag': '🇨🇱'},
-        'ZA': {'name': 'South Africa', 'flag': '🇿🇦'},
-        'RU': {'name': 'Russia', 'flag': '🇷🇺'},
-        'TR': {'name': 'Turkey', 'flag': '🇹🇷'},
-        'TH': {'name': 'Thailand', 'flag': '🇹🇭'},
-        'MY': {'name': 'Malaysia', 'flag': '🇲🇾'},
-        'ID': {'name': 'Indonesia', 'flag': '🇮🇩'},
-        'PH': {'name': 'Philippines', 'flag': '🇵🇭'},
-        'VN': {'name': 'Vietnam', 'flag': '🇻🇳'},
-        'PK': {'name': 'Pakistan', 'flag': '🇵🇰'},
-        'BD': {'name': 'Bangladesh', 'flag': '🇧🇩'},
-        'UA': {'name': 'Ukraine', 'flag': '🇺🇦'},
-        'RO': {'name': 'Romania', 'flag': '🇷🇴'},
-        'CZ': {'name': 'Czech Republic', 'flag': '🇨🇿'},
-        'GR': {'name': 'Greece', 'flag': '🇬🇷'},
-        'HU': {'name': 'Hungary', 'flag': '🇭🇺'}
-    }
-
     # Format top countries data
     top_countries_data = []
     for country_code, downloads in top_countries:
-        country_data = country_info.get(country_code, {'name': country_code, 'flag': '🌍'})
+        country_data = COUNTRY_INFO.get(country_code, {'name': country_code, 'flag': '🌍'})
         percentage = (downloads / total_all_downloads * 100) if total_all_downloads > 0 else 0
 
         top_countries_data.append({
@@ -400,33 +484,12 @@ def process_downloads_data(downloads):
         }
     }
     
-    # Map component types to expected names
-    type_mapping = {
-        'command': 'commands',
-        'commands': 'commands',
-        'agent': 'agents',
-        'agents': 'agents',
-        'setting': 'settings',
-        'settings': 'settings',
-        'hook': 'hooks',
-        'hooks': 'hooks',
-        'mcp': 'mcps',
-        'mcps': 'mcps',
-        'skill': 'skills',
-        'skills': 'skills',
-        'template': 'templates',
-        'templates': 'templates',
-        'plugin': 'plugins',
-        'plugins': 'plugins',
-        'sandbox': 'sandbox'
-    }
-    
     # Debug: Print what component types we found
     print(f"🔍 Component types found in data: {list(trending_by_type.keys())}")
     
     # Populate trending data with real data or fallback
     processed_types = set()
-    for db_type, json_type in type_mapping.items():
+    for db_type, json_type in TRENDING_TYPE_MAPPING.items():
         if json_type not in processed_types and db_type in trending_by_type:
             trending_data['trending'][json_type] = trending_by_type[db_type]
             processed_types.add(json_type)
@@ -0,0 +1,20 @@
+"""
+Shared JSON output helper for the generate_*.py scripts
+The generators run as standalone scripts from the repo root, so they import this module directly.
+"""
+
+import json
+import os
+
+def write_json_atomic(path, data, ensure_ascii=False):
+    """Write JSON to a sibling temp file, then rename it over path so readers never see a partial file"""
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=ensure_ascii)
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Don't leave a half-written temp file next to the real one
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise